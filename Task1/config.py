@@ -1,15 +1,16 @@
 from pydantic_settings import BaseSettings
 import os
+from typing import Optional
 from dotenv import load_dotenv
 
 load_dotenv()
 
 class Settings(BaseSettings):
-    GEMINI_API_KEY = os.getenv("GEMINI_API_KEY")
-    AWS_ACCESS_KEY_ID = os.getenv("AWS_ACCESS_KEY_ID")
-    AWS_SECRET_ACCESS_KEY = os.getenv("AWS_SECRET_ACCESS_KEY")
-    AWS_REGION = os.getenv("AWS_REGION")
-    MONGODB_URL = os.getenv("MONGODB_URL")
+    GEMINI_API_KEY: Optional[str] = os.getenv("GEMINI_API_KEY")
+    AWS_ACCESS_KEY_ID: Optional[str] = os.getenv("AWS_ACCESS_KEY_ID")
+    AWS_SECRET_ACCESS_KEY: Optional[str] = os.getenv("AWS_SECRET_ACCESS_KEY")
+    AWS_REGION: Optional[str] = os.getenv("AWS_REGION")
+    MONGODB_URL: Optional[str] = os.getenv("MONGODB_URL")
     
     class Config:
         env_file = ".env"
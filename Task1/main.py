@@ -5,10 +5,12 @@ from services.textract import TextractService
 from services.text_processor import TextProcessor
 from services.database import DatabaseService
 from config import settings
+from metrics import install_metrics
 import os
 from datetime import datetime
 
 app = FastAPI(title="Medical Notes Digitization API", version="1.0.0")
+install_metrics(app)
 
 # Initialize services
 textract_service = TextractService()
@@ -2,6 +2,7 @@ from motor.motor_asyncio import AsyncIOMotorClient
 from bson import ObjectId
 from typing import List, Dict, Optional
 from config import settings
+from metrics import timed
 import logging
 
 logger = logging.getLogger(__name__)
@@ -35,6 +36,7 @@ class DatabaseService:
         if self.client:
             self.client.close()
     
+    @timed("db.save_note")
     async def save_note(self, note_data: Dict) -> ObjectId:
         """Save processed note to database"""
         try:
@@ -44,6 +46,7 @@ class DatabaseService:
             logger.error(f"Failed to save note: {e}")
             raise
     
+    @timed("db.search_notes")
     async def search_notes(self, keyword: str, limit: int = 10) -> List[Dict]:
         """Search notes by keyword using text index, fallback to regex"""
         try:
@@ -75,6 +78,7 @@ class DatabaseService:
             logger.error(f"Search failed: {e}")
             raise
     
+    @timed("db.get_note")
     async def get_note(self, note_id: str) -> Optional[Dict]:
         """Get note by ID"""
         try:
@@ -87,6 +91,7 @@ class DatabaseService:
             logger.error(f"Failed to get note: {e}")
             return None
     
+    @timed("db.list_notes")
     async def list_notes(self, limit: int = 10, skip: int = 0) -> List[Dict]:
         """List notes with pagination"""
         try:
@@ -2,12 +2,14 @@ import re
 import google.generativeai as genai
 from typing import List
 from config import settings  # where your API key is stored
+from metrics import timed
 
 class TextProcessor:
     def __init__(self):
         # Configure Gemini with your API key
         genai.configure(api_key=settings.GEMINI_API_KEY)
 
+    @timed("clean_text")
     def clean_text(self, raw_text: str) -> str:
         """Clean and normalize extracted text"""
         if not raw_text:
@@ -15,6 +17,7 @@ class TextProcessor:
         cleaned = re.sub(r'\s+', ' ', raw_text.strip())
         return cleaned
 
+    @timed("extract_keywords")
     def extract_keywords(self, text: str) -> List[str]:
         """Extract medical keywords using Gemini"""
         if not text:
@@ -1,6 +1,7 @@
 import boto3
 from botocore.exceptions import ClientError
 from config import settings
+from metrics import timed
 import logging
 
 logger = logging.getLogger(__name__)
@@ -14,6 +15,7 @@ class TextractService:
             region_name=settings.AWS_REGION
         )
     
+    @timed("textract.extract_text")
     def extract_text(self, image_path: str) -> str:
         """Extract text from image using AWS Textract"""
         try:
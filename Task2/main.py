@@ -1,15 +1,25 @@
+import time
+
+_IMPORT_STARTED = time.perf_counter()
+
 import os
 import json
+import asyncio
 import logging
+import threading
 from typing import List
+from contextlib import asynccontextmanager
 from concurrent.futures import ThreadPoolExecutor, TimeoutError
 
-from fastapi import FastAPI, HTTPException
+from fastapi import Depends, FastAPI, HTTPException
+from fastapi.responses import JSONResponse
 from pydantic import BaseModel
 import google.generativeai as genai
 
 from dotenv import load_dotenv
 
+from metrics import inc, install_metrics, timed, timer
+
 load_dotenv()
 
 # ---------------- Logging ----------------
@@ -17,12 +27,61 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("main")
 
 # ---------------- Gemini Config ----------------
-api_key = os.getenv("GEMINI_API_KEY")
-if not api_key:
-    raise RuntimeError("❌ GEMINI_API_KEY not set in environment")
-
-genai.configure(api_key=api_key)
-model = genai.GenerativeModel("gemini-1.5-flash")
+# Configured by warm_up() after the server is listening
+WARMUP_RETRY_INITIAL = 1.0  # seconds, doubled after each failed attempt
+WARMUP_RETRY_MAX = 60.0
+
+model = None
+_warmup_future = None
+_stop_warmup = threading.Event()
+
+startup_state = {"ready": False, "error": None, "attempts": 0, "phases": {}}
+
+def _record_phase(name: str, started: float):
+    startup_state["phases"][name] = round(time.perf_counter() - started, 4)
+
+def _configure_model():
+    """Configure Gemini and send one warm-up request."""
+    global model
+    api_key = os.getenv("GEMINI_API_KEY")
+    if not api_key:
+        raise RuntimeError("❌ GEMINI_API_KEY not set in environment")
+
+    started = time.perf_counter()
+    genai.configure(api_key=api_key)
+    model = genai.GenerativeModel("gemini-1.5-flash")
+    _record_phase("configure_model", started)
+
+    # A failed warm-up call is usually transient, so it does not block readiness
+    if os.getenv("GEMINI_WARMUP", "1") == "1":
+        started = time.perf_counter()
+        try:
+            model.generate_content(["Reply with OK."])
+        except Exception as e:
+            logger.warning(f"⚠️ Warm-up inference failed: {e}")
+        _record_phase("warmup_inference", started)
+
+def warm_up():
+    """Run _configure_model() until it succeeds, backing off between attempts."""
+    delay = WARMUP_RETRY_INITIAL
+    while not _stop_warmup.is_set():
+        startup_state["attempts"] += 1
+        try:
+            _configure_model()
+        except Exception as e:
+            startup_state["error"] = str(e)
+            logger.error(f"Warm-up attempt {startup_state['attempts']} failed, retrying in {delay:g}s: {e}")
+            _stop_warmup.wait(delay)
+            delay = min(delay * 2, WARMUP_RETRY_MAX)
+            continue
+        startup_state["ready"] = True
+        startup_state["error"] = None
+        logger.info(f"Warm-up complete: {startup_state['phases']}")
+        return
+
+def require_ready():
+    if not startup_state["ready"]:
+        raise HTTPException(status_code=503, detail=startup_state["error"] or "Service warming up")
 
 # ---------------- Data Models ----------------
 class ClinicalNote(BaseModel):
@@ -37,6 +96,7 @@ class SummaryOutput(BaseModel):
     follow_up: str
 
 # ---------------- Helper Functions ----------------
+@timed("gemini.call_model")
 def call_model(prompt: str) -> str:
     """Call Gemini and return raw response text."""
     response = model.generate_content([prompt])
@@ -65,13 +125,15 @@ def process_note(note: ClinicalNote) -> SummaryOutput:
         future = executor.submit(call_model, prompt)
         summary_text = future.result(timeout=30)  
 
-        # Remove ```json fences if present
-        if summary_text.startswith("```"):
-            summary_text = summary_text.split("\n", 1)[1].rsplit("```", 1)[0].strip()
+        with timer("json_parse"):
+            # Remove ```json fences if present
+            if summary_text.startswith("```"):
+                summary_text = summary_text.split("\n", 1)[1].rsplit("```", 1)[0].strip()
 
-        structured_summary = json.loads(summary_text)
+            structured_summary = json.loads(summary_text)
 
     except TimeoutError:
+        inc("gemini_timeouts_total")
         logger.error(f"⏱ Timeout for note {note.note_id}")
         structured_summary = {}
     except Exception as e:
@@ -87,13 +149,26 @@ def process_note(note: ClinicalNote) -> SummaryOutput:
     )
 
 # ---------------- FastAPI App ----------------
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    global _warmup_future
+    # Do not await: the port is bound while Gemini is configured in a worker thread
+    _stop_warmup.clear()
+    _warmup_future = asyncio.get_running_loop().run_in_executor(None, warm_up)
+    yield
+    # Stop retrying; a load already in progress finishes in the background
+    _stop_warmup.set()
+    _warmup_future.cancel()
+
 app = FastAPI(
     title="Clinical Record Summarization API",
     description="Batch summarization of clinical notes into structured JSON using Gemini.",
     version="1.0.0",
+    lifespan=lifespan,
 )
+install_metrics(app)
 
-@app.post("/summarize", response_model=List[SummaryOutput])
+@app.post("/summarize", response_model=List[SummaryOutput], dependencies=[Depends(require_ready)])
 async def summarize_notes(notes: List[ClinicalNote]):
     """Summarize a batch of clinical notes."""
     try:
@@ -106,3 +181,20 @@ async def summarize_notes(notes: List[ClinicalNote]):
 @app.get("/health")
 async def health_check():
     return {"status": "healthy"}
+
+@app.get("/health/live")
+async def liveness():
+    return {"status": "alive"}
+
+@app.get("/health/ready")
+async def readiness():
+    body = {
+        "ready": startup_state["ready"],
+        "error": startup_state["error"],
+        "attempts": startup_state["attempts"],
+        "import_seconds": IMPORT_SECONDS,
+        "phases": startup_state["phases"],
+    }
+    return JSONResponse(status_code=200 if startup_state["ready"] else 503, content=body)
+
+IMPORT_SECONDS = round(time.perf_counter() - _IMPORT_STARTED, 4)
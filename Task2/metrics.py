@@ -0,0 +1,225 @@
+"""Lightweight in-process metrics exposed in Prometheus text format.
+
+The same module is kept in each service directory so every service can be
+built and deployed on its own.
+
+Usage:
+    from metrics import install_metrics, timed, timer, inc
+
+    install_metrics(app)              # request timings + GET /metrics
+
+    @timed("textract.extract_text")   # sync or async functions
+    def extract_text(...): ...
+
+    with timer("json_parse"):
+        ...
+
+    inc("gemini_timeouts_total")
+
+Set PROFILE_SAMPLE_RATE (0-1) to run that fraction of calls to functions
+decorated with @timed(..., profile=True) under cProfile. Stats are written to
+PROFILE_DIR when set, otherwise the top entries are logged.
+"""
+import cProfile
+import functools
+import inspect
+import io
+import logging
+import os
+import pstats
+import random
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Optional, Tuple
+
+logger = logging.getLogger("metrics")
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+PROFILE_SAMPLE_RATE = float(os.getenv("PROFILE_SAMPLE_RATE", "0"))
+PROFILE_DIR = os.getenv("PROFILE_DIR")
+
+_lock = threading.Lock()
+_profile_lock = threading.Lock()
+_counters: Dict[str, Dict[Tuple, float]] = {}
+_histograms: Dict[str, Dict[Tuple, list]] = {}
+
+
+def _label_key(labels: Dict[str, str]) -> Tuple:
+    return tuple(sorted((k, str(v)) for k, v in labels.items()))
+
+
+def inc(name: str, value: float = 1.0, **labels):
+    """Increment a counter."""
+    key = _label_key(labels)
+    with _lock:
+        series = _counters.setdefault(name, {})
+        series[key] = series.get(key, 0.0) + value
+
+
+def observe(name: str, seconds: float, **labels):
+    """Record one observation in a histogram."""
+    key = _label_key(labels)
+    with _lock:
+        series = _histograms.setdefault(name, {})
+        # [per-bucket counts..., sum, count]
+        state = series.get(key)
+        if state is None:
+            state = series[key] = [0] * len(DEFAULT_BUCKETS) + [0.0, 0]
+        for i, bound in enumerate(DEFAULT_BUCKETS):
+            if seconds <= bound:
+                state[i] += 1
+                break
+        state[-2] += seconds
+        state[-1] += 1
+
+
+@contextmanager
+def timer(stage: str):
+    """Time a block as a pipeline stage; exceptions are counted and re-raised."""
+    started = time.perf_counter()
+    try:
+        yield
+    except BaseException:
+        inc("stage_errors_total", stage=stage)
+        raise
+    finally:
+        observe("stage_duration_seconds", time.perf_counter() - started, stage=stage)
+
+
+def _write_profile(stage: str, profiler: cProfile.Profile):
+    stats = pstats.Stats(profiler)
+    if PROFILE_DIR:
+        os.makedirs(PROFILE_DIR, exist_ok=True)
+        stats.dump_stats(os.path.join(PROFILE_DIR, f"{stage}-{time.time_ns()}.prof"))
+    else:
+        out = io.StringIO()
+        stats.stream = out
+        stats.sort_stats("cumulative").print_stats(15)
+        logger.info(f"Profile for {stage}:\n{out.getvalue()}")
+
+
+def _run_profiled(stage: str, func, *args, **kwargs):
+    """Run func under cProfile; profiling problems never affect the call itself."""
+    # Python 3.12+ allows one active profiler per interpreter, so overlapping
+    # sampled calls run unprofiled instead of failing
+    if not _profile_lock.acquire(blocking=False):
+        return func(*args, **kwargs)
+    try:
+        try:
+            profiler = cProfile.Profile()
+            profiler.enable()
+        except Exception as e:
+            logger.warning(f"Profiling {stage} skipped: {e}")
+            profiler = None
+        try:
+            return func(*args, **kwargs)
+        finally:
+            if profiler is not None:
+                try:
+                    profiler.disable()
+                    _write_profile(stage, profiler)
+                except Exception as e:
+                    logger.warning(f"Profiling {stage} failed: {e}")
+    finally:
+        _profile_lock.release()
+
+
+def timed(stage: str, profile: bool = False):
+    """Decorator recording a function's latency under `stage`.
+
+    With profile=True, a PROFILE_SAMPLE_RATE fraction of calls are run under
+    cProfile. Only sync functions are profiled; cProfile cannot attribute time
+    across awaits.
+    """
+    def decorator(func):
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                with timer(stage):
+                    return await func(*args, **kwargs)
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with timer(stage):
+                if profile and PROFILE_SAMPLE_RATE > 0 and random.random() < PROFILE_SAMPLE_RATE:
+                    return _run_profiled(stage, func, *args, **kwargs)
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def _format_labels(key: Tuple, extra: Optional[Tuple] = None) -> str:
+    pairs = list(key) + list(extra or ())
+    if not pairs:
+        return ""
+    escaped = (
+        f'{k}="' + v.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n") + '"'
+        for k, v in pairs
+    )
+    return "{" + ",".join(escaped) + "}"
+
+
+def render() -> str:
+    """Render all metrics in Prometheus text exposition format."""
+    lines = []
+    with _lock:
+        for name in sorted(_counters):
+            lines.append(f"# TYPE {name} counter")
+            for key, value in sorted(_counters[name].items()):
+                lines.append(f"{name}{_format_labels(key)} {value}")
+        for name in sorted(_histograms):
+            lines.append(f"# TYPE {name} histogram")
+            for key, state in sorted(_histograms[name].items()):
+                cumulative = 0
+                for bound, count in zip(DEFAULT_BUCKETS, state):
+                    cumulative += count
+                    lines.append(f"{name}_bucket{_format_labels(key, (('le', str(bound)),))} {cumulative}")
+                lines.append(f"{name}_bucket{_format_labels(key, (('le', '+Inf'),))} {state[-1]}")
+                lines.append(f"{name}_sum{_format_labels(key)} {state[-2]}")
+                lines.append(f"{name}_count{_format_labels(key)} {state[-1]}")
+    return "\n".join(lines) + "\n"
+
+
+def reset():
+    """Drop all recorded metrics."""
+    with _lock:
+        _counters.clear()
+        _histograms.clear()
+
+
+def install_metrics(app):
+    """Add request timing middleware and a GET /metrics endpoint to a FastAPI app."""
+    from fastapi.responses import PlainTextResponse
+    from starlette.routing import Match
+
+    @app.middleware("http")
+    async def record_request_timing(request, call_next):
+        # Label by route template, not raw path, to keep cardinality bounded
+        route_path = "unmatched"
+        for route in app.router.routes:
+            match, _ = route.matches(request.scope)
+            if match == Match.FULL:
+                route_path = getattr(route, "path", route_path)
+                break
+
+        started = time.perf_counter()
+        status = 500
+        try:
+            response = await call_next(request)
+            status = response.status_code
+            return response
+        finally:
+            observe(
+                "http_request_duration_seconds",
+                time.perf_counter() - started,
+                method=request.method,
+                route=route_path,
+                status=status,
+            )
+
+    @app.get("/metrics", include_in_schema=False)
+    def metrics():
+        return PlainTextResponse(render(), media_type="text/plain; version=0.0.4")
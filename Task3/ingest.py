@@ -31,26 +31,8 @@ def extract_field(text: str, field_name: str) -> str:
     return ""
 
 
-def ingest(notes_path: str, persist_dir: str):
-    """Ingest clinical notes into ChromaDB with Hugging Face embeddings (incremental mode)."""
-
-    # Load notes JSON
-    if not os.path.exists(notes_path):
-        print(f"❌ Error: Notes file not found at {notes_path}")
-        sys.exit(1)
-
-    try:
-        with open(notes_path, "r", encoding="utf-8") as f:
-            notes = json.load(f)
-        if not isinstance(notes, list):
-            raise ValueError("JSON must be a list of notes.")
-    except Exception as e:
-        print(f"❌ Failed to load JSON: {e}")
-        sys.exit(1)
-
-    print(f"📥 Loaded {len(notes)} notes from {notes_path}")
-
-    # Convert notes to LangChain Documents with structured metadata
+def notes_to_documents(notes: list) -> list:
+    """Convert raw note dicts into LangChain Documents with structured metadata."""
     docs = []
     for note in notes:
         content = note.get("note", "").strip()
@@ -73,6 +55,30 @@ def ingest(notes_path: str, persist_dir: str):
         }
 
         docs.append(Document(page_content=content, metadata=metadata))
+    return docs
+
+
+def ingest(notes_path: str, persist_dir: str):
+    """Ingest clinical notes into ChromaDB with Hugging Face embeddings (incremental mode)."""
+
+    # Load notes JSON
+    if not os.path.exists(notes_path):
+        print(f"❌ Error: Notes file not found at {notes_path}")
+        sys.exit(1)
+
+    try:
+        with open(notes_path, "r", encoding="utf-8") as f:
+            notes = json.load(f)
+        if not isinstance(notes, list):
+            raise ValueError("JSON must be a list of notes.")
+    except Exception as e:
+        print(f"❌ Failed to load JSON: {e}")
+        sys.exit(1)
+
+    print(f"📥 Loaded {len(notes)} notes from {notes_path}")
+
+    # Convert notes to LangChain Documents with structured metadata
+    docs = notes_to_documents(notes)
 
     if not docs:
         print("⚠️ No valid notes found to ingest.")
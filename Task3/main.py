@@ -1,25 +1,105 @@
-from fastapi import FastAPI, HTTPException
+import time
+
+_IMPORT_STARTED = time.perf_counter()
+
+from fastapi import Depends, FastAPI, HTTPException
+from fastapi.responses import JSONResponse
 from pydantic import BaseModel
-from langchain_chroma import Chroma
-from langchain_huggingface import HuggingFaceEmbeddings
 from collections import Counter
+from contextlib import asynccontextmanager
+import asyncio
+import logging
 import os
 import re
+import threading
+
+from metrics import install_metrics, timed, timer
+
+logger = logging.getLogger("main")
 
 # Initialize
-DB_PATH = "./chroma_db"
-embeddings = HuggingFaceEmbeddings(model_name="sentence-transformers/all-MiniLM-L6-v2")
+DB_PATH = os.getenv("CHROMA_DB_PATH", "./chroma_db")
+EMBEDDING_MODEL = "sentence-transformers/all-MiniLM-L6-v2"
+WARMUP_RETRY_INITIAL = 1.0  # seconds, doubled after each failed attempt
+WARMUP_RETRY_MAX = 60.0
+
+# Heavy resources are loaded by warm_up() after the server is listening
+embeddings = None
+db = None
+_warmup_future = None
+_stop_warmup = threading.Event()
+
+startup_state = {"ready": False, "error": None, "attempts": 0, "phases": {}}
+
+def _record_phase(name: str, started: float):
+    startup_state["phases"][name] = round(time.perf_counter() - started, 4)
+
+def _load_resources():
+    """Load the embedding model and Chroma, then run one warm-up embedding."""
+    global embeddings, db
+    started = time.perf_counter()
+    from langchain_chroma import Chroma
+    from langchain_huggingface import HuggingFaceEmbeddings
+    _record_phase("import_libraries", started)
+
+    # Keep the model across attempts; only a failed load is retried
+    if embeddings is None:
+        started = time.perf_counter()
+        embeddings = HuggingFaceEmbeddings(model_name=EMBEDDING_MODEL)
+        _record_phase("load_embeddings", started)
+
+    if not os.path.exists(DB_PATH):
+        raise FileNotFoundError(f"Database not found at {DB_PATH}. Run ingest.py first.")
 
-if not os.path.exists(DB_PATH):
-    raise FileNotFoundError(f"Database not found at {DB_PATH}. Run ingest.py first.")
+    started = time.perf_counter()
+    db = Chroma(persist_directory=DB_PATH, embedding_function=embeddings)
+    _record_phase("open_db", started)
 
-db = Chroma(persist_directory=DB_PATH, embedding_function=embeddings)
-app = FastAPI(title="Clinical RAG API")
+    started = time.perf_counter()
+    embeddings.embed_query("warm-up")
+    _record_phase("warmup_inference", started)
+
+def warm_up():
+    """Run _load_resources() until it succeeds, backing off between attempts."""
+    delay = WARMUP_RETRY_INITIAL
+    while not _stop_warmup.is_set():
+        startup_state["attempts"] += 1
+        try:
+            _load_resources()
+        except Exception as e:
+            startup_state["error"] = str(e)
+            logger.error(f"Warm-up attempt {startup_state['attempts']} failed, retrying in {delay:g}s: {e}")
+            _stop_warmup.wait(delay)
+            delay = min(delay * 2, WARMUP_RETRY_MAX)
+            continue
+        startup_state["ready"] = True
+        startup_state["error"] = None
+        logger.info(f"Warm-up complete: {startup_state['phases']}")
+        return
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    global _warmup_future
+    # Do not await: the port is bound while the model loads in a worker thread
+    _stop_warmup.clear()
+    _warmup_future = asyncio.get_running_loop().run_in_executor(None, warm_up)
+    yield
+    # Stop retrying; a load already in progress finishes in the background
+    _stop_warmup.set()
+    _warmup_future.cancel()
+
+app = FastAPI(title="Clinical RAG API", lifespan=lifespan)
+install_metrics(app)
+
+def require_ready():
+    if not startup_state["ready"]:
+        raise HTTPException(status_code=503, detail=startup_state["error"] or "Service warming up")
 
 class QueryIn(BaseModel):
     q: str
 
 # Helper functions
+@timed("find_by_diagnosis", profile=True)
 def find_by_diagnosis(diagnosis: str):
     """Search patients by diagnosis (case-insensitive, multiple strategies)."""
     diagnosis_lower = diagnosis.lower().strip()
@@ -114,20 +194,35 @@ def extract_diagnosis_from_query(query: str) -> str:
 # API Endpoints
 @app.get("/")
 def root():
-    return {"message": "Clinical RAG API", "endpoints": ["/which_patients", "/most_common_treatment", "/query", "/debug/patients"]}
+    return {"message": "Clinical RAG API", "endpoints": ["/which_patients", "/most_common_treatment", "/query", "/debug/patients", "/health/live", "/health/ready", "/metrics"]}
+
+@app.get("/health/live")
+def liveness():
+    return {"status": "alive"}
 
-@app.get("/which_patients")
+@app.get("/health/ready")
+def readiness():
+    body = {
+        "ready": startup_state["ready"],
+        "error": startup_state["error"],
+        "attempts": startup_state["attempts"],
+        "import_seconds": IMPORT_SECONDS,
+        "phases": startup_state["phases"],
+    }
+    return JSONResponse(status_code=200 if startup_state["ready"] else 503, content=body)
+
+@app.get("/which_patients", dependencies=[Depends(require_ready)])
 def which_patients(diagnosis: str):
     if not diagnosis:
         raise HTTPException(status_code=400, detail="Provide ?diagnosis=...")
     matches = find_by_diagnosis(diagnosis)
     return {"diagnosis_searched": diagnosis, "matches": matches, "count": len(matches)}
 
-@app.get("/most_common_treatment")
+@app.get("/most_common_treatment", dependencies=[Depends(require_ready)])
 def get_most_common_treatment():
     return most_common_treatment()
 
-@app.post("/query")
+@app.post("/query", dependencies=[Depends(require_ready)])
 def query(q: QueryIn):
     """Handle natural language queries."""
     qtxt = q.q.lower().strip()
@@ -147,7 +242,10 @@ def query(q: QueryIn):
     # Semantic search
     else:
         try:
-            results = db.similarity_search(q.q, k=3)
+            with timer("embedding"):
+                vector = embeddings.embed_query(q.q)
+            with timer("similarity_search"):
+                results = db.similarity_search_by_vector(vector, k=3)
             return {
                 "intent": "semantic_search",
                 "results": [{"content": doc.page_content, "metadata": doc.metadata} for doc in results]
@@ -155,7 +253,7 @@ def query(q: QueryIn):
         except:
             return {"error": "Query failed. Try specific questions about patients or treatments."}
 
-@app.get("/debug/patients")
+@app.get("/debug/patients", dependencies=[Depends(require_ready)])
 def debug_patients():
     """Show all patients and extracted data."""
     try:
@@ -178,6 +276,8 @@ def debug_patients():
     except Exception as e:
         return {"error": str(e)}
 
+IMPORT_SECONDS = round(time.perf_counter() - _IMPORT_STARTED, 4)
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run("main:app", host="0.0.0.0", port=8000, reload=True)
\ No newline at end of file
@@ -0,0 +1,105 @@
+"""Compare two benchmark runs stored in benchmarks/results/history.jsonl.
+
+    python benchmarks/compare.py                        # last two runs
+    python benchmarks/compare.py --list
+    python benchmarks/compare.py --baseline 1a2b3c4d --candidate 5e6f7a8b
+"""
+import argparse
+import json
+import sys
+from pathlib import Path
+
+DEFAULT_HISTORY = Path(__file__).resolve().parent / "results" / "history.jsonl"
+COLUMNS = ["p50_ms", "p95_ms", "p99_ms", "throughput_rps"]
+
+
+def load_runs(path: Path) -> list:
+    if not path.exists():
+        return []
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def find_run(runs: list, run_id: str) -> dict:
+    for run in runs:
+        if run["run_id"] == run_id:
+            return run
+    print(f"❌ Run {run_id} not found")
+    sys.exit(1)
+
+
+def rows(run: dict) -> dict:
+    """Flatten a run into {(service, corpus_size, endpoint, concurrency): row}."""
+    flat = {}
+    for result in run["results"]:
+        for endpoint in result["endpoints"]:
+            key = (result["service"], result.get("corpus_size"), endpoint["endpoint"], endpoint["concurrency"])
+            flat[key] = endpoint
+    return flat
+
+
+def change(old: float, new: float) -> str:
+    if not old:
+        return "   n/a"
+    return f"{(new - old) / old * 100:+6.1f}%"
+
+
+def describe(run: dict) -> str:
+    label = f" ({run['label']})" if run.get("label") else ""
+    return f"{run['run_id']}{label} @ {run['git_commit']} {run['timestamp']}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare two benchmark runs")
+    parser.add_argument("--history", default=str(DEFAULT_HISTORY))
+    parser.add_argument("--baseline", help="Run id (default: second most recent)")
+    parser.add_argument("--candidate", help="Run id (default: most recent)")
+    parser.add_argument("--list", action="store_true", help="List stored runs and exit")
+    args = parser.parse_args()
+
+    runs = load_runs(Path(args.history))
+    if args.list:
+        for run in runs:
+            print(describe(run))
+        return
+    if len(runs) < 2 and not (args.baseline and args.candidate):
+        print("⚠️ Need at least two runs to compare.")
+        sys.exit(1)
+
+    baseline = find_run(runs, args.baseline) if args.baseline else runs[-2]
+    candidate = find_run(runs, args.candidate) if args.candidate else runs[-1]
+    print(f"baseline:  {describe(baseline)}")
+    print(f"candidate: {describe(candidate)}\n")
+
+    # Each cell shows the candidate value and its change against the baseline
+    old_rows, new_rows = rows(baseline), rows(candidate)
+    header = f"{'service':<8} {'corpus':>8} {'endpoint':<20} {'conc':>4}" + "".join(f"{c:>20}" for c in COLUMNS)
+    print(header)
+    print("-" * len(header))
+    for key in sorted(set(old_rows) & set(new_rows), key=lambda k: tuple(str(part) for part in k)):
+        service, corpus_size, endpoint, concurrency = key
+        old, new = old_rows[key], new_rows[key]
+        cells = "".join(f"{new[c]:>12} {change(old[c], new[c])}" for c in COLUMNS)
+        print(f"{service:<8} {corpus_size or '':>8} {endpoint:<20} {concurrency:>4}{cells}")
+
+    print("\npeak RSS (MB)")
+    old_rss = {(r["service"], r.get("corpus_size")): r["peak_rss_mb"] for r in baseline["results"]}
+    for result in candidate["results"]:
+        key = (result["service"], result.get("corpus_size"))
+        if key in old_rss and old_rss[key] is not None and result["peak_rss_mb"] is not None:
+            label = f"{key[0]} {key[1] or ''}".strip()
+            print(f"  {label:<16} {old_rss[key]:>8} → {result['peak_rss_mb']:>8} {change(old_rss[key], result['peak_rss_mb'])}")
+
+    for name, run in (("baseline", baseline), ("candidate", candidate)):
+        for result in run["results"]:
+            if result.get("error"):
+                label = f"{result['service']} {result.get('corpus_size') or ''}".strip()
+                print(f"\n❌ {label} failed in the {name} run: {result['error']}")
+
+    skipped = set(old_rows) ^ set(new_rows)
+    if skipped:
+        print(f"\n{len(skipped)} rows present in only one run were skipped (different services, sizes or concurrency).")
+
+
+if __name__ == "__main__":
+    main()
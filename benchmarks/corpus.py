@@ -0,0 +1,109 @@
+"""Synthetic clinical note corpora for benchmarking.
+
+Notes follow the format of Task3/sample_data/notes.json, so they can be fed
+to Task3/ingest.py as well as to the benchmark runner:
+
+    python benchmarks/corpus.py --size 100000 --out notes_100k.json
+
+With --index-dir the notes are loaded straight into a Chroma store using
+FakeEmbeddings, which is how run.py prepares Task3 corpora:
+
+    python benchmarks/corpus.py --size 1000000 --index-dir benchmarks/.cache/task3-1000000-0
+"""
+import argparse
+import itertools
+import json
+import os
+import random
+import sys
+from pathlib import Path
+
+TASK3_DIR = Path(__file__).resolve().parent.parent / "Task3"
+
+CONDITIONS = [
+    # (presentation, diagnosis, treatment, follow-up)
+    ("chest pain radiating to the left arm", "Acute myocardial infarction", "Aspirin, Nitroglycerin, Beta blocker", "Cardiology in 2 weeks"),
+    ("cough and fever", "Community-acquired pneumonia", "Amoxicillin 1g TID for 7 days", "Primary care in 1 week"),
+    ("severe headache and photophobia", "Migraine", "Sumatriptan PRN", "Neurology PRN"),
+    ("polyuria and elevated blood glucose", "Type 2 diabetes", "Metformin 500mg BID", "Endocrinology in 3 months"),
+    ("elevated blood pressure on repeat readings", "Hypertension", "Lisinopril 10mg daily", "Primary care in 4 weeks"),
+    ("wheezing and chronic cough", "COPD exacerbation", "Prednisone, Albuterol nebulizer", "Pulmonology in 2 weeks"),
+    ("right lower quadrant pain", "Acute appendicitis", "Laparoscopic appendectomy", "Surgery clinic in 10 days"),
+    ("progressive memory loss", "Alzheimer disease", "Donepezil 5mg daily", "Neurology in 6 months"),
+    ("pelvic pain and dysmenorrhea", "Endometriosis", "Oral contraceptives, NSAIDs", "Gynecology in 3 months"),
+    ("knee pain worse with activity", "Osteoarthritis", "Acetaminophen, Physical therapy", "Orthopedics in 8 weeks"),
+    ("persistent worry and insomnia", "Generalized anxiety disorder", "Sertraline 50mg daily", "Psychiatry in 4 weeks"),
+    ("low mood and anhedonia", "Major depression", "Fluoxetine 20mg daily, CBT", "Psychiatry in 2 weeks"),
+]
+FIRST_NAMES = ["John", "Mary", "Alice", "Robert", "Linda", "James", "Patricia", "Michael", "Susan", "David", "Karen", "Omar", "Priya", "Wei", "Fatima"]
+LAST_NAMES = ["Doe", "Smith", "Johnson", "Brown", "Garcia", "Miller", "Davis", "Khan", "Patel", "Chen", "Lopez", "Wilson"]
+
+
+def iter_notes(size: int, seed: int = 0):
+    """Yield `size` deterministic notes; about 1 in 20 has an empty diagnosis like the sample data."""
+    rng = random.Random(seed)
+    for i in range(size):
+        presentation, diagnosis, treatment, follow_up = rng.choice(CONDITIONS)
+        if rng.random() < 0.05:
+            diagnosis = ""
+        yield {
+            "patient_id": f"P{i + 1:07d}",
+            "name": f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}",
+            "age": rng.randint(18, 90),
+            "note": f"Patient presents with {presentation}. Diagnosis: {diagnosis}. Treatment: {treatment}. Follow-up: {follow_up}."
+        }
+
+
+def generate_notes(size: int, seed: int = 0) -> list:
+    return list(iter_notes(size, seed))
+
+
+def diagnosis_terms() -> list:
+    """Lower-case diagnosis search terms that occur in generated notes."""
+    return ["myocardial infarction", "pneumonia", "migraine", "diabetes", "hypertension", "copd",
+            "appendicitis", "alzheimer", "endometriosis", "osteoarthritis", "anxiety", "depression", "headache"]
+
+
+def build_index(notes, persist_dir: str, embeddings, batch_size: int = 5000):
+    """Load notes into a Chroma store the same way Task3/ingest.py does, in batches.
+
+    Notes are shorter than ingest.py's 500-character chunk size, so they are
+    added without splitting.
+    """
+    sys.path.insert(0, str(TASK3_DIR))
+    from langchain_chroma import Chroma
+    from ingest import notes_to_documents
+
+    os.makedirs(persist_dir, exist_ok=True)
+    db = Chroma(persist_directory=persist_dir, embedding_function=embeddings)
+    notes = iter(notes)
+    while True:
+        batch = list(itertools.islice(notes, batch_size))
+        if not batch:
+            break
+        db.add_documents(notes_to_documents(batch))
+    return db
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Generate a synthetic clinical notes corpus")
+    parser.add_argument("--size", type=int, required=True, help="Number of notes")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed")
+    parser.add_argument("--out", help="Output JSON path (default: stdout)")
+    parser.add_argument("--index-dir", help="Build a Chroma store here instead of writing JSON")
+    args = parser.parse_args()
+
+    if args.index_dir:
+        from fakes import FakeEmbeddings
+
+        build_index(iter_notes(args.size, args.seed), args.index_dir, FakeEmbeddings())
+        print(f"✅ Indexed {args.size} notes into {args.index_dir}")
+        sys.exit(0)
+
+    notes = generate_notes(args.size, args.seed)
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            json.dump(notes, f, indent=2)
+        print(f"✅ Wrote {len(notes)} notes to {args.out}")
+    else:
+        json.dump(notes, sys.stdout, indent=2)
@@ -0,0 +1,281 @@
+"""Deterministic local stand-ins for AWS Textract, Gemini and MongoDB.
+
+Every fake takes a FaultInjector that adds a fixed (plus optional seeded
+jitter) delay to each call and fails a seeded fraction of calls, so
+benchmark runs are repeatable without network access.
+"""
+import asyncio
+import hashlib
+import json
+import math
+import random
+import re
+import threading
+import time
+from types import SimpleNamespace
+
+KEYWORD_VOCABULARY = [
+    "fever", "cough", "chest pain", "hypertension", "diabetes", "pneumonia",
+    "headache", "migraine", "amoxicillin", "metformin", "aspirin", "lisinopril",
+    "blood pressure", "glucose", "shortness of breath", "nausea", "fatigue",
+    "ecg", "x-ray", "insulin",
+]
+PATIENT_NAMES = ["John Doe", "Mary Smith", "Alice Johnson", "Robert Brown", "Linda Garcia"]
+
+
+class FakeServiceError(Exception):
+    """Raised by a fake when the injector decides a call should fail."""
+
+
+class FaultInjector:
+    """Seeded latency and error injection shared by the fakes."""
+
+    def __init__(self, latency_ms: float = 0.0, jitter_ms: float = 0.0, error_rate: float = 0.0, seed: int = 0):
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def _draw(self):
+        with self._lock:
+            delay = (self.latency_ms + self._rng.uniform(0, self.jitter_ms)) / 1000
+            fail = self._rng.random() < self.error_rate
+        return delay, fail
+
+    def wait(self, what: str):
+        """Block like a synchronous SDK call."""
+        delay, fail = self._draw()
+        if delay:
+            time.sleep(delay)
+        if fail:
+            raise FakeServiceError(f"Injected {what} failure")
+
+    async def async_wait(self, what: str):
+        """Yield to the event loop like an async driver call."""
+        delay, fail = self._draw()
+        if delay:
+            await asyncio.sleep(delay)
+        if fail:
+            raise FakeServiceError(f"Injected {what} failure")
+
+
+def _digest(data) -> int:
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    return int.from_bytes(hashlib.sha256(data).digest()[:8], "big")
+
+
+def _pick(seed: int, items: list, count: int) -> list:
+    rng = random.Random(seed)
+    return rng.sample(items, min(count, len(items)))
+
+
+# ---------------- Textract ----------------
+class FakeTextractClient:
+    """Stand-in for boto3's Textract client; only detect_document_text is used."""
+
+    def __init__(self, injector: FaultInjector):
+        self.injector = injector
+
+    def detect_document_text(self, Document: dict) -> dict:
+        try:
+            self.injector.wait("textract")
+        except FakeServiceError as e:
+            from botocore.exceptions import ClientError
+            raise ClientError({"Error": {"Code": "ThrottlingException", "Message": str(e)}}, "DetectDocumentText")
+
+        seed = _digest(Document.get("Bytes", b""))
+        name = PATIENT_NAMES[seed % len(PATIENT_NAMES)]
+        terms = _pick(seed, KEYWORD_VOCABULARY, 4)
+        lines = [
+            f"Patient: {name}",
+            f"Complains of {terms[0]} and {terms[1]}.",
+            f"Plan: {terms[2]}, review {terms[3]}.",
+        ]
+        return {"Blocks": [{"BlockType": "LINE", "Text": line} for line in lines]}
+
+
+# ---------------- Gemini ----------------
+class FakeGenerativeModel:
+    """Stand-in for genai.GenerativeModel answering the prompts used in Task1 and Task2."""
+
+    def __init__(self, injector: FaultInjector):
+        self.injector = injector
+
+    def generate_content(self, contents):
+        prompt = contents[0] if isinstance(contents, list) else contents
+        self.injector.wait("gemini")
+        seed = _digest(prompt)
+
+        if "JSON list of strings" in prompt:
+            # Task1 keyword extraction
+            text = json.dumps(_pick(seed, KEYWORD_VOCABULARY, 5))
+        else:
+            # Task2 summarization, fenced like the real model often returns
+            summary = {
+                "patient": PATIENT_NAMES[seed % len(PATIENT_NAMES)],
+                "diagnosis": _pick(seed, KEYWORD_VOCABULARY, 1)[0],
+                "treatment": ", ".join(_pick(seed >> 8, KEYWORD_VOCABULARY, 2)),
+                "follow_up": f"{seed % 14 + 1} days",
+            }
+            text = "```json\n" + json.dumps(summary) + "\n```"
+        return SimpleNamespace(text=text)
+
+
+def install_fake_gemini(injector: FaultInjector):
+    """Patch google.generativeai so configure() is a no-op and models are fakes."""
+    import google.generativeai as genai
+
+    genai.configure = lambda **kwargs: None
+    genai.GenerativeModel = lambda *args, **kwargs: FakeGenerativeModel(injector)
+
+
+# ---------------- MongoDB ----------------
+def _matches(doc: dict, query: dict, text_fields: list) -> bool:
+    for key, cond in query.items():
+        if key == "$or":
+            if not any(_matches(doc, sub, text_fields) for sub in cond):
+                return False
+        elif key == "$text":
+            terms = cond["$search"].lower().split()
+            haystack = " ".join(
+                " ".join(v) if isinstance(v, list) else str(v)
+                for v in (doc.get(f, "") for f in text_fields)
+            ).lower()
+            if not any(term in haystack.split() for term in terms):
+                return False
+        elif isinstance(cond, dict) and "$regex" in cond:
+            flags = re.IGNORECASE if "i" in cond.get("$options", "") else 0
+            value = doc.get(key, "")
+            values = value if isinstance(value, list) else [value]
+            if not any(re.search(cond["$regex"], str(v), flags) for v in values):
+                return False
+        elif doc.get(key) != cond:
+            return False
+    return True
+
+
+class FakeCursor:
+    def __init__(self, collection, query: dict):
+        self._collection = collection
+        self._query = query
+        self._skip = 0
+        self._limit = 0
+        self._sort = None
+
+    def skip(self, n: int):
+        self._skip = n
+        return self
+
+    def limit(self, n: int):
+        self._limit = n
+        return self
+
+    def sort(self, key: str, direction: int = 1):
+        self._sort = (key, direction)
+        return self
+
+    async def __aiter__(self):
+        await self._collection.injector.async_wait("mongo")
+        docs = [d for d in self._collection.docs if _matches(d, self._query, self._collection.text_fields)]
+        if self._sort:
+            key, direction = self._sort
+            docs.sort(key=lambda d: d.get(key), reverse=direction < 0)
+        docs = docs[self._skip:]
+        if self._limit:
+            docs = docs[:self._limit]
+        for doc in docs:
+            yield dict(doc)
+
+
+class FakeCollection:
+    """In-memory collection supporting the queries DatabaseService issues.
+
+    Queries are linear scans, so search latency grows with collection size
+    where real MongoDB would use the text index.
+    """
+
+    def __init__(self, injector: FaultInjector):
+        self.injector = injector
+        self.docs = []
+        self.text_fields = []
+
+    async def create_index(self, keys, **kwargs):
+        self.text_fields = [field for field, kind in keys if kind == "text"]
+        return "_".join(self.text_fields) + "_text"
+
+    async def insert_one(self, document: dict):
+        from bson import ObjectId
+
+        await self.injector.async_wait("mongo")
+        document.setdefault("_id", ObjectId())
+        self.docs.append(dict(document))
+        return SimpleNamespace(inserted_id=document["_id"])
+
+    def find(self, query: dict = None):
+        return FakeCursor(self, query or {})
+
+    async def find_one(self, query: dict):
+        async for doc in FakeCursor(self, query).limit(1):
+            return doc
+        return None
+
+
+class FakeMotorClient:
+    """Stand-in for AsyncIOMotorClient; any database/collection name is accepted."""
+
+    def __init__(self, injector: FaultInjector):
+        self.injector = injector
+        self._collections = {}
+
+    def __getattr__(self, name: str):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return _FakeDatabase(self, name)
+
+    def close(self):
+        pass
+
+
+class _FakeDatabase:
+    def __init__(self, client: FakeMotorClient, name: str):
+        self._client = client
+        self._name = name
+
+    def __getattr__(self, name: str):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        key = (self._name, name)
+        if key not in self._client._collections:
+            self._client._collections[key] = FakeCollection(self._client.injector)
+        return self._client._collections[key]
+
+
+# ---------------- Embeddings ----------------
+class FakeEmbeddings:
+    """Deterministic hashed bag-of-words embeddings, a stand-in for HuggingFaceEmbeddings.
+
+    Notes sharing words land close together, so similarity search returns
+    plausible neighbours without downloading a model.
+    """
+
+    def __init__(self, injector: FaultInjector = None, dimensions: int = 384, **kwargs):
+        self.injector = injector or FaultInjector()
+        self.dimensions = dimensions
+
+    def _embed(self, text: str) -> list:
+        vector = [0.0] * self.dimensions
+        for token in re.findall(r"[a-z0-9]+", text.lower()):
+            h = _digest(token)
+            vector[h % self.dimensions] += 1.0 if (h >> 32) & 1 else -1.0
+        norm = math.sqrt(sum(v * v for v in vector)) or 1.0
+        return [v / norm for v in vector]
+
+    def embed_documents(self, texts: list) -> list:
+        self.injector.wait("embedding")
+        return [self._embed(t) for t in texts]
+
+    def embed_query(self, text: str) -> list:
+        self.injector.wait("embedding")
+        return self._embed(text)
@@ -0,0 +1,383 @@
+"""Offline end-to-end benchmark for the Task1, Task2 and Task3 services.
+
+Each service runs in its own subprocess with Textract, Gemini, MongoDB and the
+embedding model replaced by the local fakes in fakes.py. Requests are sent
+in-process through httpx's ASGI transport at each concurrency level, and the
+results are appended to benchmarks/results/history.jsonl:
+
+    python benchmarks/run.py --services task3 --corpus-size 1000 100000 --concurrency 1 8 32
+    python benchmarks/compare.py
+"""
+import argparse
+import asyncio
+import json
+import logging
+import math
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import uuid
+from datetime import datetime, timezone
+from pathlib import Path
+
+from corpus import diagnosis_terms, generate_notes
+from fakes import FakeEmbeddings, FakeMotorClient, FakeTextractClient, FaultInjector, install_fake_gemini
+
+BENCH_DIR = Path(__file__).resolve().parent
+REPO_ROOT = BENCH_DIR.parent
+CACHE_DIR = BENCH_DIR / ".cache"
+DEFAULT_HISTORY = BENCH_DIR / "results" / "history.jsonl"
+SERVICE_DIRS = {"task1": "Task1", "task2": "Task2", "task3": "Task3"}
+STARTUP_TIMEOUT = 300  # seconds to wait for a service to become ready
+
+
+# ---------------- Measurement ----------------
+def percentile(sorted_values: list, pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(0, math.ceil(pct / 100 * len(sorted_values)) - 1)
+    return sorted_values[rank]
+
+
+def peak_rss_mb():
+    try:
+        import resource
+    except ImportError:  # Windows
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is bytes on macOS and kilobytes on Linux
+    return round(peak / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+
+
+def is_error(response) -> bool:
+    """5xx, or a 200 whose JSON body carries an "error" key.
+
+    Task3 catches failed embedding/search calls and returns 200 {"error": ...}.
+    """
+    if response.status_code >= 500:
+        return True
+    try:
+        body = response.json()
+    except ValueError:
+        return False
+    return isinstance(body, dict) and "error" in body
+
+
+async def drive(client, send, total: int, concurrency: int) -> dict:
+    """Send `total` requests with `concurrency` in flight and summarise latencies."""
+    latencies = []
+    errors = 0
+    indexes = iter(range(total))
+
+    async def worker():
+        nonlocal errors
+        for i in indexes:
+            started = time.perf_counter()
+            try:
+                response = await send(client, i)
+            except Exception:
+                response = None
+            latencies.append(time.perf_counter() - started)
+            if response is None or is_error(response):
+                errors += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    wall = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        "concurrency": concurrency,
+        "requests": total,
+        "errors": errors,
+        "p50_ms": round(percentile(latencies, 50) * 1000, 2),
+        "p95_ms": round(percentile(latencies, 95) * 1000, 2),
+        "p99_ms": round(percentile(latencies, 99) * 1000, 2),
+        "throughput_rps": round(total / wall, 2) if wall else 0.0,
+    }
+
+
+def parse_stage_metrics(text: str) -> dict:
+    """Mean latency per stage from the service's /metrics output."""
+    sums, counts = {}, {}
+    for line in text.splitlines():
+        for suffix, target in (("_sum", sums), ("_count", counts)):
+            prefix = f"stage_duration_seconds{suffix}{{stage=\""
+            if line.startswith(prefix):
+                stage, value = line[len(prefix):].split("\"} ")
+                target[stage] = float(value)
+    return {
+        stage: {"count": int(counts[stage]), "mean_ms": round(sums[stage] / counts[stage] * 1000, 2)}
+        for stage in sorted(counts) if counts[stage]
+    }
+
+
+# ---------------- Service setup ----------------
+# Injectors created for the service under test; faults are off until startup is done
+_injectors = []
+
+
+def injector(config: dict, latency_key: str, offset: int) -> FaultInjector:
+    fault_injector = FaultInjector(
+        latency_ms=config[latency_key],
+        jitter_ms=config["jitter_ms"],
+        error_rate=0.0,
+        seed=config["seed"] + offset,
+    )
+    _injectors.append(fault_injector)
+    return fault_injector
+
+
+def enable_faults(config: dict):
+    """Apply --error-rate to benchmarked traffic only, never to startup or warm-up."""
+    for fault_injector in _injectors:
+        fault_injector.error_rate = config["error_rate"]
+
+
+def setup_task1(config: dict):
+    os.environ.setdefault("AWS_REGION", "us-east-1")
+    os.environ.setdefault("GEMINI_API_KEY", "offline-benchmark")
+    install_fake_gemini(injector(config, "gemini_latency_ms", 1))
+
+    import services.database
+    mongo = FakeMotorClient(injector(config, "mongo_latency_ms", 2))
+    services.database.AsyncIOMotorClient = lambda *args, **kwargs: mongo
+
+    import main
+    main.textract_service.client = FakeTextractClient(injector(config, "textract_latency_ms", 3))
+
+    image = (REPO_ROOT / "Task1" / "sample_data" / "handwritten_notes" / "image.png").read_bytes()
+    keywords = ["fever", "cough", "diabetes", "aspirin", "glucose", "migraine"]
+
+    async def upload(client, i):
+        # Unique names: the service writes uploads to temp_<filename> in its cwd
+        files = {"file": (f"note-{i}.png", image + i.to_bytes(4, "big"), "image/png")}
+        return await client.post("/upload-note/", files=files)
+
+    async def search(client, i):
+        return await client.get("/search/", params={"keyword": keywords[i % len(keywords)]})
+
+    return main, [("POST /upload-note/", upload), ("GET /search/", search)]
+
+
+def setup_task2(config: dict):
+    os.environ.setdefault("GEMINI_API_KEY", "offline-benchmark")
+    install_fake_gemini(injector(config, "gemini_latency_ms", 1))
+
+    import main
+
+    notes = [
+        {"note_id": n["patient_id"], "text": n["note"]}
+        for n in generate_notes(max(config["batch_size"] * 16, 1), config["seed"])
+    ]
+
+    async def summarize(client, i):
+        start = (i * config["batch_size"]) % len(notes)
+        return await client.post("/summarize", json=notes[start:start + config["batch_size"]])
+
+    return main, [("POST /summarize", summarize)]
+
+
+def setup_task3(config: dict):
+    import langchain_huggingface
+
+    embeddings_injector = injector(config, "embedding_latency_ms", 4)
+    langchain_huggingface.HuggingFaceEmbeddings = lambda **kwargs: FakeEmbeddings(embeddings_injector)
+
+    import main
+
+    terms = diagnosis_terms()
+    questions = [
+        "Tell me about chest pain cases",
+        "Which patients have {}?",
+        "Notes mentioning blood glucose control",
+        "Who has {}?",
+    ]
+
+    async def which_patients(client, i):
+        return await client.get("/which_patients", params={"diagnosis": terms[i % len(terms)]})
+
+    async def query(client, i):
+        question = questions[i % len(questions)].format(terms[i % len(terms)])
+        return await client.post("/query", json={"q": question})
+
+    return main, [("GET /which_patients", which_patients), ("POST /query", query)]
+
+
+SETUPS = {"task1": setup_task1, "task2": setup_task2, "task3": setup_task3}
+
+
+# ---------------- Worker (one service per process) ----------------
+async def bench_service(service: str, config: dict) -> dict:
+    import httpx
+
+    sys.path.insert(0, str(REPO_ROOT / SERVICE_DIRS[service]))
+    started = time.perf_counter()
+    main, scenarios = SETUPS[service](config)
+    import_seconds = time.perf_counter() - started
+
+    endpoints = []
+    # Runs the app's lifespan, or its on_event handlers when it has none (Task1)
+    async with main.app.router.lifespan_context(main.app):
+        if getattr(main, "_warmup_future", None) is not None:
+            # warm_up() retries until it succeeds, so bound the wait
+            try:
+                await asyncio.wait_for(asyncio.shield(main._warmup_future), STARTUP_TIMEOUT)
+            except asyncio.TimeoutError:
+                raise RuntimeError(f"{service} failed to warm up: {main.startup_state['error']}")
+        startup_seconds = time.perf_counter() - started
+        enable_faults(config)
+
+        transport = httpx.ASGITransport(app=main.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://benchmark", timeout=None) as client:
+            for endpoint, send in scenarios:
+                for concurrency in config["concurrency"]:
+                    result = await drive(client, send, config["requests"], concurrency)
+                    endpoints.append({"endpoint": endpoint, **result})
+                    print(f"  {service} {endpoint} c={concurrency}: p50={result['p50_ms']}ms "
+                          f"p99={result['p99_ms']}ms {result['throughput_rps']} req/s", flush=True)
+            stages = parse_stage_metrics((await client.get("/metrics")).text)
+
+    return {
+        "service": service,
+        "import_seconds": round(import_seconds, 3),
+        "startup_seconds": round(startup_seconds, 3),
+        "startup_phases": getattr(main, "startup_state", {}).get("phases", {}),
+        "endpoints": endpoints,
+        "stages": stages,
+        "peak_rss_mb": peak_rss_mb(),
+    }
+
+
+def run_worker(service: str, config: dict, result_file: str):
+    # Services may enable INFO logging; keep httpx from logging every request
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+    try:
+        result = asyncio.run(bench_service(service, config))
+    except Exception as e:
+        # Leave the reason for the driver, then fail as before
+        with open(result_file, "w", encoding="utf-8") as f:
+            json.dump(failed_result(service, f"{type(e).__name__}: {e}"), f)
+        raise
+    with open(result_file, "w", encoding="utf-8") as f:
+        json.dump(result, f)
+
+
+# ---------------- Driver ----------------
+def failed_result(service: str, error: str) -> dict:
+    """Result entry for a service that could not be benchmarked."""
+    return {"service": service, "error": error, "endpoints": [], "stages": {}, "peak_rss_mb": None}
+
+
+def prepare_corpus(size: int, seed: int) -> Path:
+    """Build (or reuse) a cached Chroma store of `size` synthetic notes."""
+    index_dir = CACHE_DIR / f"task3-{size}-{seed}"
+    marker = index_dir / ".complete"
+    if not marker.exists():
+        print(f"📦 Building Task3 corpus of {size} notes in {index_dir}", flush=True)
+        subprocess.run(
+            [sys.executable, str(BENCH_DIR / "corpus.py"), "--size", str(size), "--seed", str(seed),
+             "--index-dir", str(index_dir)],
+            check=True,
+        )
+        marker.touch()
+    return index_dir
+
+
+def spawn_worker(service: str, config: dict, env: dict = None) -> dict:
+    """Benchmark one service in a subprocess; a failure becomes an error entry."""
+    with tempfile.TemporaryDirectory() as workdir:
+        result_file = os.path.join(workdir, "result.json")
+        completed = subprocess.run(
+            [sys.executable, str(Path(__file__).resolve()), "--worker", service,
+             "--worker-config", json.dumps(config), "--result-file", result_file],
+            cwd=workdir,
+            env={**os.environ, **(env or {})},
+        )
+        if os.path.exists(result_file):
+            with open(result_file, encoding="utf-8") as f:
+                return json.load(f)
+        return failed_result(service, f"worker exited with code {completed.returncode}")
+
+
+def git_commit():
+    try:
+        out = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=REPO_ROOT,
+                             capture_output=True, text=True, check=True)
+        return out.stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Offline benchmark for the Task1-3 services")
+    parser.add_argument("--services", nargs="+", choices=sorted(SETUPS), default=sorted(SETUPS))
+    parser.add_argument("--concurrency", nargs="+", type=int, default=[1, 8, 32])
+    parser.add_argument("--requests", type=int, default=200, help="Requests per endpoint and concurrency level")
+    parser.add_argument("--corpus-size", nargs="+", type=int, default=[1000], help="Task3 corpus sizes")
+    parser.add_argument("--batch-size", type=int, default=5, help="Notes per /summarize request")
+    parser.add_argument("--textract-latency-ms", type=float, default=200.0)
+    parser.add_argument("--gemini-latency-ms", type=float, default=300.0)
+    parser.add_argument("--mongo-latency-ms", type=float, default=2.0)
+    parser.add_argument("--embedding-latency-ms", type=float, default=5.0)
+    parser.add_argument("--jitter-ms", type=float, default=0.0, help="Extra uniform random delay per fake call")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of fake calls that fail")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--label", help="Free-form name stored with the run")
+    parser.add_argument("--history", default=str(DEFAULT_HISTORY), help="JSONL file runs are appended to")
+    parser.add_argument("--worker", choices=sorted(SETUPS), help=argparse.SUPPRESS)
+    parser.add_argument("--worker-config", help=argparse.SUPPRESS)
+    parser.add_argument("--result-file", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        run_worker(args.worker, json.loads(args.worker_config), args.result_file)
+        return
+
+    config = {k: v for k, v in vars(args).items() if not k.startswith(("worker", "result", "history", "label"))}
+    results = []
+    for service in args.services:
+        if service != "task3":
+            print(f"▶ {service}", flush=True)
+            results.append(spawn_worker(service, config))
+            continue
+        for size in args.corpus_size:
+            try:
+                index_dir = prepare_corpus(size, args.seed)
+            except subprocess.CalledProcessError as e:
+                results.append({**failed_result(service, f"corpus build exited with code {e.returncode}"), "corpus_size": size})
+                continue
+            print(f"▶ task3 (corpus {size})", flush=True)
+            result = spawn_worker(service, config, env={"CHROMA_DB_PATH": str(index_dir)})
+            results.append({**result, "corpus_size": size})
+
+    run = {
+        "run_id": uuid.uuid4().hex[:8],
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "git_commit": git_commit(),
+        "label": args.label,
+        "config": config,
+        "results": results,
+    }
+    history = Path(args.history)
+    history.parent.mkdir(parents=True, exist_ok=True)
+    with open(history, "a", encoding="utf-8") as f:
+        f.write(json.dumps(run) + "\n")
+
+    print(f"\n✅ Run {run['run_id']} saved to {history}")
+    failed = [result for result in results if result.get("error")]
+    for result in results:
+        label = f"{result['service']} {result.get('corpus_size') or ''}".strip()
+        if result.get("error"):
+            print(f"❌ {label}: {result['error']}")
+        else:
+            print(f"{label}: startup {result['startup_seconds']}s, peak RSS {result['peak_rss_mb']} MB")
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()